@@ -1,3 +1,7 @@
+import argparse
+import csv
+import sys
+
 # Default values. Change these to match your area.
 DEFAULT_DAILY_USAGE_KWH = 38
 DEFAULT_ELECTRICITY_COST = 0.2233
@@ -36,6 +40,17 @@ def calculate_annual_savings_per_dollar(A, C):
     """Calculates annual savings per dollar spent."""
     return A / C
 
+def analyze_unit(C, S, O, U, E):
+    """
+    Computes energy savings, annual savings, ROI, and annual savings per dollar for one AC unit.
+    Shared by the interactive calculator and the batch mode.
+    """
+    ES = calculate_energy_savings(S)
+    A = calculate_annual_savings(U, E, ES)
+    ROI = calculate_roi(A, O, C)
+    V = calculate_annual_savings_per_dollar(A, C)
+    return ES, A, ROI, V
+
 def calculate_ac_value():
     """
     Calculates and prints the energy savings, annual savings, ROI, and annual savings per dollar
@@ -50,10 +65,7 @@ def calculate_ac_value():
     U = get_positive_float(f"Enter the estimated daily usage in kWh by the AC system (default {DEFAULT_DAILY_USAGE_KWH}): ", DEFAULT_DAILY_USAGE_KWH)
     E = get_positive_float(f"Enter the average electricity cost per kWh (default ${DEFAULT_ELECTRICITY_COST:.4f}): ", DEFAULT_ELECTRICITY_COST)
 
-    ES = calculate_energy_savings(S)
-    A = calculate_annual_savings(U, E, ES)
-    ROI = calculate_roi(A, O, C)
-    V = calculate_annual_savings_per_dollar(A, C)
+    ES, A, ROI, V = analyze_unit(C, S, O, U, E)
 
     print("\n--- AC Value Analysis ---")
     print(f"Energy Savings compared to SEER 16: {ES:.2%}")
@@ -62,8 +74,59 @@ def calculate_ac_value():
     print(f"Annual Savings per Dollar Spent: ${V:.4f}")
     print("--------------------------\n")
 
+def calculate_batch(input_path, output_file):
+    """
+    Scores every AC unit listed in a CSV file and writes the results as CSV.
+
+    The input needs a header row with the columns cost, seer and years. The columns
+    daily_usage_kwh and electricity_cost are optional and fall back to the defaults.
+    Each output row repeats the inputs followed by the four calculated values.
+    Raises ValueError if a required column is missing from the header.
+    """
+    with open(input_path, newline="") as input_file:
+        reader = csv.DictReader(input_file)
+        missing = [name for name in ("cost", "seer", "years") if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{input_path} is missing required column(s): {', '.join(missing)}")
+        writer = csv.writer(output_file)
+        writer.writerow(["cost", "seer", "years", "daily_usage_kwh", "electricity_cost",
+                         "energy_savings", "annual_savings", "roi_percent", "savings_per_dollar"])
+        for row in reader:
+            try:
+                C = float(row["cost"])
+                S = float(row["seer"])
+                O = float(row["years"])
+                U = float(row.get("daily_usage_kwh") or DEFAULT_DAILY_USAGE_KWH)
+                E = float(row.get("electricity_cost") or DEFAULT_ELECTRICITY_COST)
+                if min(C, S, O, U, E) < 0:
+                    raise ValueError("values must be positive")
+                ES, A, ROI, V = analyze_unit(C, S, O, U, E)
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+                print(f"Skipping line {reader.line_num}: {e!r}", file=sys.stderr)
+                continue
+            writer.writerow([C, S, O, U, E, f"{ES:.4f}", f"{A:.2f}", f"{ROI:.2f}", f"{V:.4f}"])
+
 def main():
     """Main function to run the AC Value Calculator."""
+    parser = argparse.ArgumentParser(description="Estimate the value of a new AC unit.")
+    parser.add_argument("--batch", metavar="CSV_PATH",
+                        help="Score every unit in a CSV file instead of prompting interactively")
+    parser.add_argument("--output", metavar="CSV_PATH",
+                        help="Where to write batch results (default: standard output)")
+    args = parser.parse_args()
+
+    if args.batch:
+        try:
+            if args.output:
+                with open(args.output, "w", newline="") as output_file:
+                    calculate_batch(args.batch, output_file)
+            else:
+                calculate_batch(args.batch, sys.stdout)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     print("Welcome to the AC Value Calculator!")
     while True:
         calculate_ac_value()
@@ -1,6 +1,10 @@
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of output lines buffered before they are written to stdout
+OUTPUT_CHUNK_LINES = 1000
 
 def is_windows():
     """Check if the current operating system is Windows."""
@@ -15,82 +19,140 @@ def normalize_path(path):
     """
     return path.replace('\\', '/') if is_windows() else path
 
-def print_tree(root_path, prefix="", max_depth=None, current_depth=0, include_files=True, visited=None):
+def scan_directory(path):
     """
-    Recursively prints the directory tree structure.
+    Lists a directory and sorts its entries case-insensitively, using Unicode case folding.
 
-    :param root_path: The root directory path to print the tree from.
-    :param prefix: The prefix string used for formatting.
-    :param max_depth: The maximum depth to recurse into.
-    :param current_depth: The current recursion depth.
-    :param include_files: Whether to include files in the output.
-    :param visited: Set of visited paths to prevent infinite loops with symlinks.
+    :param path: The directory path to list.
+    :return: A tuple of (entries, error) where exactly one is None.
     """
-    # Initialize visited set if not provided
-    if visited is None:
-        visited = set()
-
-    # Check if we've reached the maximum depth
-    if max_depth is not None and current_depth > max_depth:
-        print(prefix + "└── [Max Depth Reached]")
-        return
-
     try:
-        # Get and sort directory entries
-        entries = sorted(os.listdir(root_path), key=lambda s: s.lower())
+        with os.scandir(path) as it:
+            entries = list(it)
+        entries.sort(key=lambda e: (e.name.casefold(), e.name))
+        return entries, None
     except PermissionError:
-        print(prefix + "└── [Permission Denied]")
-        return
+        return None, "[Permission Denied]"
     except FileNotFoundError:
-        print(prefix + "└── [Path Not Found]")
-        return
+        return None, "[Path Not Found]"
     except Exception as e:
-        print(prefix + f"└── [Error: {e}]")
-        return
-
-    directories = []
-    files = []
-
-    # Separate directories and files, handling symlinks
-    for entry in entries:
-        path = os.path.join(root_path, entry)
-        if os.path.islink(path):
-            # Handle symbolic links
-            real_path = os.path.realpath(path)
-            if real_path in visited:
-                print(prefix + f"└── {entry} -> [Symbolic Link Loop]")
-                continue
-            visited.add(real_path)
-            if os.path.isdir(real_path):
+        return None, f"[Error: {e}]"
+
+def classify_entry(entry):
+    """
+    Classifies a directory entry using the type information cached on the DirEntry.
+
+    :param entry: The os.DirEntry to classify.
+    :return: A tuple of (is_link, is_dir), where is_dir follows symbolic links.
+    """
+    is_link = entry.is_symlink()
+    return is_link, entry.is_dir(follow_symlinks=is_link)
+
+def print_tree(root_path, prefix="", max_depth=None, current_depth=0, include_files=True, executor=None,
+               follow_symlinks=False):
+    """
+    Prints the directory tree structure, walking it with an explicit stack.
+
+    :param root_path: The root directory path to print the tree from.
+    :param prefix: The prefix string used for formatting.
+    :param max_depth: The maximum depth to descend into.
+    :param current_depth: The depth of root_path.
+    :param include_files: Whether to include files in the output.
+    :param executor: Optional executor used to list subdirectories concurrently.
+    :param follow_symlinks: Whether to descend into symlinked directories. When False, symbolic
+        links are shown as leaves and never resolved.
+    """
+    # Real paths of symlinks on the current branch, used to prevent infinite loops
+    visited = set()
+    added_by_depth = {}
+
+    # Collect output lines and write them in chunks rather than printing one at a time
+    lines = []
+    emit = lines.append
+
+    # Each frame is (line to print, directory to expand, prefix, depth, pending listing)
+    stack = [(None, root_path, prefix, current_depth, None)]
+    while stack:
+        line, path, prefix, depth, pending = stack.pop()
+        if line is not None:
+            emit(line)
+        if len(lines) >= OUTPUT_CHUNK_LINES:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+        if path is None:
+            continue
+
+        # Links recorded at this depth or deeper belong to subtrees that are already finished
+        for level in [level for level in added_by_depth if level >= depth]:
+            visited.difference_update(added_by_depth.pop(level))
+
+        # Check if we've reached the maximum depth
+        if max_depth is not None and depth > max_depth:
+            emit(prefix + "└── [Max Depth Reached]")
+            continue
+
+        # Get and sort directory entries, reusing a prefetched listing if available
+        entries, error = pending.result() if pending is not None else scan_directory(path)
+        if error:
+            emit(prefix + "└── " + error)
+            continue
+
+        directories = []
+        files = []
+        added = added_by_depth[depth] = []
+
+        # Separate directories and files, handling symlinks
+        for entry in entries:
+            is_link, is_dir = classify_entry(entry)
+            if is_link and follow_symlinks:
+                # Handle symbolic links
+                real_path = os.path.realpath(entry.path)
+                if real_path in visited:
+                    emit(prefix + f"└── {entry.name} -> [Symbolic Link Loop]")
+                    continue
+                visited.add(real_path)
+                added.append(real_path)
+            if is_dir:
                 directories.append(entry)
             elif include_files:
                 files.append(entry)
-        elif os.path.isdir(path):
-            directories.append(entry)
-        elif include_files:
-            files.append(entry)
-
-    # Combine sorted directories and files
-    sorted_entries = directories + files
-    entries_count = len(sorted_entries)
-
-    # Print each entry
-    for index, entry in enumerate(sorted_entries):
-        path = os.path.join(root_path, entry)
-        is_last = index == (entries_count - 1)
-        connector = "└── " if is_last else "├── "
-
-        if os.path.islink(path):
-            # Display symbolic links with their targets
-            target = os.readlink(path)
-            print(f"{prefix}{connector}{entry} -> {target}")
-        else:
-            print(f"{prefix}{connector}{entry}")
-
-        if os.path.isdir(path):
-            # Recursively print subdirectories
-            extension = "    " if is_last else "│   "
-            print_tree(path, prefix + extension, max_depth, current_depth + 1, include_files, visited.copy())
+
+        # Combine sorted directories and files
+        sorted_entries = directories + files
+        entries_count = len(sorted_entries)
+
+        # Symlinked directories are only descended into when following links
+        subdirectories = {entry.path for entry in directories if follow_symlinks or not entry.is_symlink()}
+
+        # Start listing all subdirectories at once so their latency overlaps
+        prefetched = {}
+        if executor is not None and (max_depth is None or depth < max_depth):
+            prefetched = {entry.path: executor.submit(scan_directory, entry.path)
+                          for entry in directories if entry.path in subdirectories}
+
+        # Queue each entry, pushing in reverse so they pop in sorted order
+        children = []
+        for index, entry in enumerate(sorted_entries):
+            is_last = index == (entries_count - 1)
+            connector = "└── " if is_last else "├── "
+
+            if entry.is_symlink():
+                # Display symbolic links with their targets
+                target = os.readlink(entry.path)
+                child_line = f"{prefix}{connector}{entry.name} -> {target}"
+            else:
+                child_line = f"{prefix}{connector}{entry.name}"
+
+            if entry.path in subdirectories:
+                # Descend into subdirectories once this line is printed
+                extension = "    " if is_last else "│   "
+                children.append((child_line, entry.path, prefix + extension, depth + 1, prefetched.get(entry.path)))
+            else:
+                children.append((child_line, None, None, None, None))
+        stack.extend(reversed(children))
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """
@@ -103,7 +165,12 @@ def main():
     parser.add_argument("path", nargs="?", default=".", help="Root directory path")
     parser.add_argument("-d", "--depth", type=int, help="Maximum depth of recursion")
     parser.add_argument("-f", "--files", action="store_true", help="Include files in the tree")
+    parser.add_argument("-L", "--follow-symlinks", action="store_true",
+                        help="Descend into symlinked directories, detecting symlink loops")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of directories to list concurrently")
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("argument -j/--jobs: must be at least 1")
 
     root = args.path
 
@@ -121,7 +188,9 @@ def main():
     print(f"Directory structure for: {abs_root}")
 
     # Start printing the tree
-    print_tree(abs_root, max_depth=args.depth, include_files=args.files)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        print_tree(abs_root, max_depth=args.depth, include_files=args.files, executor=executor,
+                   follow_symlinks=args.follow_symlinks)
 
 if __name__ == "__main__":
     main()
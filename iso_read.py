@@ -1,12 +1,22 @@
 import sys
 import os
+import stat
 import struct
+import mmap
+import bisect
 
 # Constants
 BYTES_TO_READ = 2048
 SECTOR_SIZE = 4
 REGION_SIZE = 8
 
+# Precompiled big-endian layouts for the region count and each (start, end) region
+_U32 = struct.Struct('>I')
+_REGION = struct.Struct('>II')
+
+# Maps each byte to itself if printable ASCII, otherwise to '.'
+_PRINTABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
 # Simple logging functions
 def log_info(message: str) -> None:
     print(f"[INFO] {message}")
@@ -14,16 +24,16 @@ def log_info(message: str) -> None:
 def log_error(message: str) -> None:
     print(f"[ERROR] {message}", file=sys.stderr)
 
-def read_iso_header(file_path: str, bytes_to_read: int = BYTES_TO_READ) -> bytes:
+def read_iso_header(file_path: str, bytes_to_read: int = BYTES_TO_READ) -> mmap.mmap:
     """
-    Reads the header of an ISO file.
+    Maps the header of an ISO file into memory.
 
     Args:
         file_path (str): Path to the ISO file.
         bytes_to_read (int, optional): Number of bytes to read from the header. Defaults to BYTES_TO_READ.
 
     Returns:
-        bytes: The header data of the ISO file.
+        mmap.mmap: A read-only mapping of the header data. The caller is responsible for closing it.
 
     Raises:
         FileNotFoundError: If the file does not exist.
@@ -35,10 +45,21 @@ def read_iso_header(file_path: str, bytes_to_read: int = BYTES_TO_READ) -> bytes
             raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
         with open(file_path, 'rb') as iso_file:
-            header_data = iso_file.read(bytes_to_read)
-            if len(header_data) < bytes_to_read:
-                log_error(f"Expected {bytes_to_read} bytes, but only read {len(header_data)} bytes.")
-                sys.exit(1)
+            st = os.fstat(iso_file.fileno())
+            if stat.S_ISREG(st.st_mode):
+                if st.st_size < bytes_to_read:
+                    log_error(f"Expected {bytes_to_read} bytes, but the file is only {st.st_size} bytes long.")
+                    sys.exit(1)
+                header_data = mmap.mmap(iso_file.fileno(), bytes_to_read, access=mmap.ACCESS_READ)
+            else:
+                # Devices such as /dev/sr0 report a size of 0 and may not support mmap,
+                # so read them and copy the data into an anonymous mapping instead
+                data = iso_file.read(bytes_to_read)
+                if len(data) < bytes_to_read:
+                    log_error(f"Expected {bytes_to_read} bytes, but only read {len(data)} bytes.")
+                    sys.exit(1)
+                header_data = mmap.mmap(-1, bytes_to_read)
+                header_data.write(data)
 
         log_info("ISO header successfully read.")
         return header_data
@@ -53,12 +74,13 @@ def read_iso_header(file_path: str, bytes_to_read: int = BYTES_TO_READ) -> bytes
         log_error(f"An unexpected error occurred: {str(e)}")
         sys.exit(1)
 
-def parse_sector0(header_data: bytes) -> list:
+def parse_sector0(header_data: bytes, verbose: bool = True) -> list:
     """
     Parses the first sector of the ISO header to extract unencrypted regions.
 
     Args:
         header_data (bytes): The header data from the ISO file.
+        verbose (bool, optional): Whether to log each region. Defaults to True.
 
     Returns:
         list: A list of tuples representing unencrypted regions (start_sector, end_sector).
@@ -67,26 +89,51 @@ def parse_sector0(header_data: bytes) -> list:
         log_error("Insufficient data to read the number of unencrypted regions.")
         return []
 
-    number_of_regions = struct.unpack('>I', header_data[:SECTOR_SIZE])[0]
+    number_of_regions = _U32.unpack_from(header_data)[0]
     log_info(f"Number of Unencrypted Regions: {number_of_regions}")
 
-    if number_of_regions * REGION_SIZE + SECTOR_SIZE > len(header_data):
+    regions_end = SECTOR_SIZE + number_of_regions * REGION_SIZE
+    if regions_end > len(header_data):
         log_error("Header data is too short for the specified number of regions.")
         return []
 
-    regions = []
-    offset = SECTOR_SIZE
-    for region_index in range(number_of_regions):
-        if offset + REGION_SIZE > len(header_data):
-            log_error(f"Unexpected end of data while reading region {region_index + 1}.")
-            break
-        start_sector, end_sector = struct.unpack('>II', header_data[offset:offset + REGION_SIZE])
-        regions.append((start_sector, end_sector))
-        log_info(f"Region {region_index + 1}: Start Sector = {start_sector}, End Sector = {end_sector}")
-        offset += REGION_SIZE
+    regions = list(_REGION.iter_unpack(header_data[SECTOR_SIZE:regions_end]))
+    if verbose:
+        for region_index, (start_sector, end_sector) in enumerate(regions, start=1):
+            log_info(f"Region {region_index}: Start Sector = {start_sector}, End Sector = {end_sector}")
 
     return regions
 
+def sort_regions(regions: list) -> list:
+    """
+    Prepares regions for find_region, which needs them ordered by start sector.
+
+    Args:
+        regions (list): Regions as returned by parse_sector0, in the order stored on disc.
+
+    Returns:
+        list: A sorted copy of the regions.
+    """
+    return sorted(regions)
+
+def find_region(regions: list, sector: int):
+    """
+    Finds the unencrypted region containing a sector using binary search.
+
+    Args:
+        regions (list): Non-overlapping regions sorted by start sector, as returned by sort_regions.
+        sector (int): The sector to look up.
+
+    Returns:
+        tuple or None: The (start_sector, end_sector) region containing the sector, or None if the
+        sector is encrypted. Both bounds are inclusive.
+    """
+    # Tuples compare element-wise, so this lands just past the last region starting at or before sector
+    index = bisect.bisect_right(regions, (sector, float('inf')))
+    if index and regions[index - 1][1] >= sector:
+        return regions[index - 1]
+    return None
+
 def display_hex(header_data: bytes, bytes_per_line: int = 16) -> None:
     """
     Displays a hex dump of the header data.
@@ -96,11 +143,23 @@ def display_hex(header_data: bytes, bytes_per_line: int = 16) -> None:
         bytes_per_line (int, optional): Number of bytes per line in the dump. Defaults to 16.
     """
     log_info("\nHex Dump of Sector 0:")
+    dump = bytearray()
     for i in range(0, len(header_data), bytes_per_line):
         line = header_data[i:i + bytes_per_line]
-        hex_values = ' '.join(f"{byte:02X}" for byte in line)
-        ascii_representation = ''.join((chr(byte) if 32 <= byte <= 126 else '.') for byte in line)
-        print(f"{i:04X}: {hex_values:<{bytes_per_line * 3}} | {ascii_representation}")
+        dump += b"%04X: " % i
+        dump += line.hex(' ').upper().encode('ascii').ljust(bytes_per_line * 3)
+        dump += b" | "
+        dump += line.translate(_PRINTABLE)
+        dump += b"\n"
+
+    # The dump is pure ASCII, so write it straight to the binary layer when there is one
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    if stdout_buffer is None:
+        sys.stdout.write(dump.decode('ascii'))
+        return
+    sys.stdout.flush()
+    stdout_buffer.write(dump)
+    stdout_buffer.flush()
 
 def main() -> None:
     """
@@ -114,15 +173,15 @@ def main() -> None:
     iso_path = sys.argv[1]
     log_info(f"Reading ISO header from: {iso_path}")
     
-    header_data = read_iso_header(iso_path)
-    regions = parse_sector0(header_data)
-    
-    if regions:
-        log_info("Successfully parsed unencrypted regions.")
-    else:
-        log_info("No unencrypted regions found or failed to parse regions.")
-    
-    display_hex(header_data)
+    with read_iso_header(iso_path) as header_data:
+        regions = parse_sector0(header_data)
+
+        if regions:
+            log_info("Successfully parsed unencrypted regions.")
+        else:
+            log_info("No unencrypted regions found or failed to parse regions.")
+
+        display_hex(header_data)
 
 if __name__ == "__main__":
     main()
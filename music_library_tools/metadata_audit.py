@@ -1,24 +1,35 @@
 import os
 import json
+import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from mutagen import File
 from colorama import init, Fore, Style, Back
 
 init(autoreset=True)  # Initialize colorama
 
+# Color escape sequences, bound once instead of looked up on every message
+_RED, _GREEN, _CYAN, _RST = Fore.RED, Fore.GREEN, Fore.CYAN, Style.RESET_ALL
+
 # Define default log file name
-DEFAULT_LOG_FILE = 'metadata_audit_log.json'
+DEFAULT_LOG_FILE = 'metadata_audit_log.jsonl'
+
+# Define default cache file, recording albums that passed the audit unchanged
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'metadata_audit', 'index.json')
+
+# File extensions (without the dot) treated as music files
+AUDIO_EXTENSIONS = frozenset({'mp3', 'flac', 'ogg', 'wav'})
+
+# Maximum number of files read concurrently within an album
+MAX_WORKERS = 8
 
 # Predefined album artist categories
 DEFAULT_CATEGORIES = [
     "Film", "Musical", "Video Game", "Video Game Remix", "Other"
 ]
 
-# Placeholder for logging issues
-log_data = {
-    "missing_metadata": [],
-    "invalid_metadata": []
-}
+# Open log file; issues are appended as JSON lines as soon as they are found
+log_stream = None
 
 def parse_arguments():
     """
@@ -49,9 +60,128 @@ def parse_arguments():
         default=DEFAULT_CATEGORIES,
         help=f"List of allowed album artist categories (default: {DEFAULT_CATEGORIES})."
     )
+    parser.add_argument(
+        '--cache-file',
+        type=str,
+        default=DEFAULT_CACHE_FILE,
+        help=f"Path to the cache of already verified albums (default: {DEFAULT_CACHE_FILE})."
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Re-check every album, even those unchanged since they last passed the audit."
+    )
     return parser.parse_args()
 
-def audit_album_metadata(root_path, dry_run=False, categories=DEFAULT_CATEGORIES, log_file=DEFAULT_LOG_FILE):
+def is_music_file(name):
+    """
+    Check whether a file name has a music extension.
+    Only the extension is lowercased, not the whole name.
+
+    Args:
+        name (str): The file name.
+
+    Returns:
+        bool: True if the extension is in AUDIO_EXTENSIONS.
+    """
+    _, dot, ext = name.rpartition('.')
+    return bool(dot) and ext.lower() in AUDIO_EXTENSIONS
+
+def iter_album_dirs(root_path):
+    """
+    Walk the library top-down, yielding only folders that contain music files.
+    Where available, os.fwalk is used so files can be opened and stat'ed relative
+    to an open directory descriptor instead of resolving their full path each time.
+
+    Args:
+        root_path (str): Path to the directory to walk.
+
+    Yields:
+        tuple: (folder_path, music_file_names, folder_fd) where folder_fd is None on
+        platforms without os.fwalk. The descriptor is only valid until the next iteration.
+    """
+    if hasattr(os, 'fwalk'):
+        # fwalk does not follow symlinks, not even the top one, so resolve the library
+        # path itself and report folders relative to the path as given
+        real_root = os.path.realpath(root_path)
+        walker = (
+            (root_path + root[len(real_root):], dirs, files, root_fd)
+            for root, dirs, files, root_fd in os.fwalk(real_root)
+        )
+    else:
+        walker = ((root, dirs, files, None) for root, dirs, files in os.walk(root_path))
+
+    for root, dirs, files, root_fd in walker:
+        album_files = [f for f in files if is_music_file(f)]
+        if album_files:
+            yield root, album_files, root_fd
+
+def album_signature(root, album_files, root_fd=None, categories=()):
+    """
+    Summarize the modification state of an album folder and its music files.
+
+    Args:
+        root (str): Path to the album folder.
+        album_files (list): Names of the folder's music files.
+        root_fd (int, optional): Open descriptor for the folder, if available.
+        categories (list): Allowed album artist categories the album was audited against.
+
+    Returns:
+        str or None: A digest that changes whenever a music file is added, removed or
+        modified or the allowed categories change, or None if the files could not be inspected.
+    """
+    try:
+        root_stat = os.stat(root_fd) if root_fd is not None else os.stat(root)
+        digest = hashlib.sha1(str(root_stat.st_mtime_ns).encode())
+        digest.update("\0".join(sorted(categories)).encode())
+        for name in sorted(album_files):
+            if root_fd is not None:
+                st = os.stat(name, dir_fd=root_fd)
+            else:
+                st = os.stat(os.path.join(root, name))
+            digest.update(f"\0{name}\0{st.st_mtime_ns}\0{st.st_size}".encode())
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+def load_cache(cache_file):
+    """
+    Load the cache of albums that previously passed the audit.
+
+    Args:
+        cache_file (str): Path to the cache file.
+
+    Returns:
+        dict: Mapping of absolute album paths to their album_signature.
+    """
+    try:
+        with open(cache_file) as cache:
+            return json.load(cache)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Ignoring unreadable cache file: {e}")
+        return {}
+
+def save_cache(album_cache, cache_file):
+    """
+    Atomically write the cache of albums that passed the audit.
+
+    Args:
+        album_cache (dict): Mapping of absolute album paths to their album_signature.
+        cache_file (str): Path to the cache file.
+    """
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+        temp_file = f"{cache_file}.tmp"
+        with open(temp_file, 'w') as cache:
+            json.dump(album_cache, cache)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        print(f"Error saving cache file: {e}")
+
+def audit_album_metadata(root_path, dry_run=False, categories=DEFAULT_CATEGORIES, log_file=DEFAULT_LOG_FILE,
+                         cache_file=None, force=False):
     """
     Check and interactively update metadata at the album level.
     
@@ -60,45 +190,53 @@ def audit_album_metadata(root_path, dry_run=False, categories=DEFAULT_CATEGORIES
         dry_run (bool): If True, simulate actions without making changes.
         categories (list): List of allowed album artist categories.
         log_file (str): Path to the log file.
+        cache_file (str, optional): Path to the cache of verified albums. Caching is disabled if None.
+        force (bool): If True, re-check albums even if the cache says they are unchanged.
     """
-    for root, dirs, files in os.walk(root_path):
-        # Only process non-empty folders containing music files
-        album_files = [f for f in files if f.lower().endswith(('.mp3', '.flac', '.ogg', '.wav'))]
-        if not album_files:
-            continue  # Skip empty directories or non-music folders
+    album_cache = load_cache(cache_file) if cache_file else None
+    skipped_albums = 0
+    seen_albums = set()
+
+    for root, album_files, root_fd in iter_album_dirs(root_path):
+        # Skip albums that passed the audit and have not changed since
+        if album_cache is not None:
+            album_key = os.path.abspath(root)
+            seen_albums.add(album_key)
+            signature = album_signature(root, album_files, root_fd, categories)
+            if not force and signature is not None and album_cache.get(album_key) == signature:
+                skipped_albums += 1
+                continue
+            album_cache.pop(album_key, None)
 
         print(f"\nProcessing album folder: {os.path.basename(root)}")
 
         # Initialize album-wide fields
         album_name, album_artist, album_year = None, None, None
 
-        # Collect all metadata across the album
+        # Read every file in the album concurrently, then collect the metadata in order
+        file_paths = [os.path.join(root, file) for file in album_files]
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(file_paths))) as executor:
+            results = list(executor.map(lambda file_path: load_metadata(file_path, root_fd), file_paths))
+
         album_metadata = []
-        for file in album_files:
-            file_path = os.path.join(root, file)
-            try:
-                audio = File(file_path, easy=True)
-                album = audio.get('album', [None])[0]
-                title = audio.get('title', [None])[0]
-                album_artist = audio.get('albumartist', [album_artist])[0]  # Preserve the first valid artist found
-                year = extract_year(audio)
-                album_metadata.append({
-                    "file_path": file_path,
-                    "album": album,
-                    "title": title,
-                    "album_artist": album_artist,
-                    "year": year
-                })
-
-                # Check for missing album-wide fields
-                if not album_name and album:
-                    album_name = album  # Use the first found album name
-                if not album_year and year:
-                    album_year = year  # Use the first valid year found
-            except Exception as e:
-                log_data['invalid_metadata'].append({"file": file_path, "error": str(e)})
+        load_failed = False
+        for file_path, metadata, error in results:
+            if error:
+                load_failed = True
+                log_issue('invalid_metadata', {"file": file_path, "error": error})
                 continue
 
+            if metadata['album_artist'] is not None:
+                album_artist = metadata['album_artist']  # Preserve the last artist found when a file has none
+            metadata['album_artist'] = album_artist
+            album_metadata.append(metadata)
+
+            # Check for missing album-wide fields
+            if not album_name and metadata['album']:
+                album_name = metadata['album']  # Use the first found album name
+            if not album_year and metadata['year']:
+                album_year = metadata['year']  # Use the first valid year found
+
         # Check if album-level fields are missing or inconsistent across the album
         inconsistent_album = any(item['album'] != album_name for item in album_metadata if item['album'])
         inconsistent_year = any(item['year'] != album_year for item in album_metadata if item['year'])
@@ -113,6 +251,10 @@ def audit_album_metadata(root_path, dry_run=False, categories=DEFAULT_CATEGORIES
         if not album_year or inconsistent_year:
             missing_fields.append("Year")
 
+        # Remember albums with no issues so unchanged ones can be skipped next time
+        if album_cache is not None and not missing_fields and not load_failed and signature is not None:
+            album_cache[album_key] = signature
+
         # Display album-wide metadata issues and prompt for batch update
         if missing_fields:
             print(f"  Issues found for album '{os.path.basename(root)}':")
@@ -148,47 +290,107 @@ def audit_album_metadata(root_path, dry_run=False, categories=DEFAULT_CATEGORIES
                         print("[DRY RUN] Confirmed. No changes will be made.")
                     else:
                         print("Applying changes...")
-                        for item in album_metadata:
-                            update_metadata(
-                                item['file_path'],
-                                album=album_name,
-                                artist=album_artist,
-                                year=album_year
-                            )
+                        # Reuse the files loaded during the audit and save them concurrently
+                        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(album_metadata)))) as executor:
+                            results = list(executor.map(
+                                lambda item: update_metadata(
+                                    item,
+                                    album=album_name,
+                                    artist=album_artist,
+                                    year=album_year
+                                ),
+                                album_metadata
+                            ))
+                        for file_path, error in results:
+                            if error:
+                                print(f"  Error updating file: {error}")
+                                log_issue('invalid_metadata', {"file": file_path, "error": error})
+                            else:
+                                print(f"  Updated metadata for: {file_path}")
                     break
                 elif response == 'n':
                     print("Skipping changes for this album.")
                     break
                 elif response == 'q':
                     print("Quitting the script.")
+                    if album_cache is not None:
+                        save_cache(album_cache, cache_file)
                     save_log(log_file)
                     exit(0)
                 else:
                     print("Invalid input. Please enter 'y', 'n', or 'q'.")
 
-def update_metadata(file_path, album=None, artist=None, year=None):
+    if album_cache is not None:
+        # Forget albums under this library that were moved or deleted since they were cached
+        library_root = os.path.abspath(root_path)
+        library_prefix = os.path.join(library_root, '')
+        for album_key in list(album_cache):
+            in_library = album_key == library_root or album_key.startswith(library_prefix)
+            if in_library and album_key not in seen_albums:
+                del album_cache[album_key]
+        save_cache(album_cache, cache_file)
+        if skipped_albums:
+            print(f"\nSkipped {skipped_albums} unchanged album(s) that already passed the audit (use --force to re-check).")
+
+def load_metadata(file_path, dir_fd=None):
     """
-    Update metadata fields for a given file.
-    
+    Read the album-level metadata of a single file.
+    Safe to call from worker threads; errors are returned rather than logged.
+
     Args:
         file_path (str): Path to the music file.
+        dir_fd (int, optional): Open descriptor for the file's folder. If given,
+            the file is opened relative to it rather than by its full path.
+
+    Returns:
+        tuple: (file_path, metadata, error) where metadata is a dict (including the
+        loaded 'audio' object) or None, and error is a message string or None.
+    """
+    try:
+        if dir_fd is not None:
+            name = os.path.basename(file_path)
+            with open(file_path, 'rb', opener=lambda _, flags: os.open(name, flags, dir_fd=dir_fd)) as fileobj:
+                audio = File(fileobj, easy=True)
+        else:
+            audio = File(file_path, easy=True)
+        metadata = {
+            "file_path": file_path,
+            "album": audio.get('album', [None])[0],
+            "title": audio.get('title', [None])[0],
+            "album_artist": audio.get('albumartist', [None])[0],
+            "year": extract_year(audio),
+            "audio": audio
+        }
+        return file_path, metadata, None
+    except Exception as e:
+        return file_path, None, str(e)
+
+def update_metadata(item, album=None, artist=None, year=None):
+    """
+    Update metadata fields for a file already loaded by load_metadata.
+    Safe to call from worker threads; errors are returned rather than logged.
+
+    Args:
+        item (dict): Metadata entry holding the loaded 'audio' object and its 'file_path'.
         album (str, optional): New album name.
         artist (str, optional): New album artist.
         year (str, optional): New year.
+
+    Returns:
+        tuple: (file_path, error) where error is a message string or None.
     """
     try:
-        audio = File(file_path, easy=True)
+        audio = item['audio']
         if album:
             audio['album'] = album
         if artist:
             audio['albumartist'] = artist
         if year:
             audio['date'] = year
-        audio.save()
-        print(f"  Updated metadata for: {file_path}")
+        audio.save(item['file_path'])
+        return item['file_path'], None
     except Exception as e:
-        print(f"  Error updating file: {e}")
-        log_data['invalid_metadata'].append({"file": file_path, "error": str(e)})
+        return item['file_path'], str(e)
 
 def extract_year(audio_file):
     """
@@ -235,24 +437,50 @@ def prompt_for_input(field_name, current_value, dry_run, allowed_values=None, va
         else:
             return new_value
 
+def open_log(log_file):
+    """
+    Open the log file for appending. Each issue is written as one JSON line,
+    so the log stays valid even if the script is interrupted.
+
+    Args:
+        log_file (str): Path to the log file.
+    """
+    global log_stream
+    try:
+        log_stream = open(log_file, 'a', buffering=1)
+    except Exception as e:
+        print(f"Error opening log file: {e}")
+
+def log_issue(category, entry):
+    """
+    Append a single issue to the log file.
+
+    Args:
+        category (str): The kind of issue, e.g. 'invalid_metadata'.
+        entry (dict): Details of the issue.
+    """
+    if log_stream is not None:
+        log_stream.write(json.dumps({"category": category, **entry}) + "\n")
+
 def save_log(log_file):
     """
-    Save log data to a JSON file for easy inspection.
-    
+    Close the log file once all issues have been written.
+
     Args:
         log_file (str): Path to the log file.
     """
+    global log_stream
+    if log_stream is None:
+        return
     try:
-        with open(log_file, 'w') as log:
-            json.dump(log_data, log, indent=4)
+        log_stream.close()
         print(f"\nLog saved to {log_file}")
     except Exception as e:
         print(f"Error saving log file: {e}")
+    log_stream = None
 
 def highlight_changes(old_value, new_value):
-    if old_value != new_value:
-        return f"{Fore.RED}{old_value}{Style.RESET_ALL} -> {Fore.GREEN}{new_value}{Style.RESET_ALL}"
-    return old_value
+    return f"{_RED}{old_value}{_RST} -> {_GREEN}{new_value}{_RST}" if old_value != new_value else old_value
 
 def display_proposed_changes(root_path, album_metadata, album_name, album_artist, album_year):
     print(f"\nProposed updates for album '{os.path.basename(root_path)}':")
@@ -261,7 +489,7 @@ def display_proposed_changes(root_path, album_metadata, album_name, album_artist
     for item in album_metadata:
         relative_path = os.path.relpath(item['file_path'], root_path)
         truncated_path = truncate_path(relative_path)
-        print(f"    {Fore.CYAN}{truncated_path}")
+        print(f"    {_CYAN}{truncated_path}")
         print(f"      Old -> Album: '{highlight_changes(item['album'], album_name)}', "
               f"Artist: '{highlight_changes(item['album_artist'], album_artist)}', "
               f"Year: '{highlight_changes(item['year'], album_year)}'")
@@ -277,11 +505,14 @@ def truncate_path(path, max_length=50):
 
 def main():
     args = parse_arguments()
+    open_log(args.log_file)
     audit_album_metadata(
         root_path=args.library_path,
         dry_run=args.dry_run,
         categories=args.categories,
-        log_file=args.log_file
+        log_file=args.log_file,
+        cache_file=args.cache_file,
+        force=args.force
     )
     save_log(args.log_file)
 
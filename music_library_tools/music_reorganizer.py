@@ -3,15 +3,30 @@ import shutil
 import json
 import argparse
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from mutagen import File
 from colorama import init, Fore, Style, Back
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 init(autoreset=True)  # Initialize colorama
 
+# Color escape sequences, bound once instead of looked up on every message
+_RED, _GREEN, _CYAN, _YELLOW = Fore.RED, Fore.GREEN, Fore.CYAN, Fore.YELLOW
+_RST = Style.RESET_ALL
+
 # Define default log file name
 DEFAULT_LOG_FILE = "music_reorg_log.json"
 
+# Define default cache file name
+DEFAULT_CACHE_FILE = "music_reorg_cache.json"
+
 # Placeholder for logging issues
 log_data = {
     "missing_metadata": [],
@@ -20,6 +35,31 @@ log_data = {
     "invalid_date_metadata": [],
 }
 
+# Tags of album sample files from previous runs, keyed by absolute path
+metadata_cache = {}
+
+# Maximum number of album sample files read concurrently
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of albums ahead of the current one whose sample files are read in advance
+PREFETCH_DEPTH = 32
+
+# Read buffer for tag reads; large enough for a typical ID3v2 or Vorbis comment block
+TAG_READ_BUFFER = 128 * 1024
+
+# Replaces slashes with hyphens and drops characters that are invalid in filenames
+_SANITIZE_TABLE = str.maketrans({"/": "-", **dict.fromkeys('<>:"|?*')})
+
+# Precompiled patterns used on every album and file name
+_RX_UNWANTED_TERMS = re.compile(
+    r"\b(?:Original Motion Picture Soundtrack|Original Soundtrack|Soundtrack|OST)\b",
+    re.IGNORECASE,
+)
+_RX_TRIM_EDGES = re.compile(r"^[\s\-\(\{\[]+|[\s\-\)\}\]]+$")
+_RX_FMT_YEAR = re.compile(r"\s*\([^)]*\)\s*\[\d{4}\]$")
+_RX_ARTIST_BRACKET = re.compile(r"^(.*?)\s*\[(.*?)\]$")
+_RX_DISC_TRACK = re.compile(r"^(\d+)\s*-\s*(\d+)\s*[.-]\s*(.+)$")
+
 # Configure logging for debugging purposes
 # logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
 
@@ -38,11 +78,30 @@ def parse_arguments():
         default=DEFAULT_LOG_FILE,
         help=f"Path to the log file (default: {DEFAULT_LOG_FILE}).",
     )
+    parser.add_argument(
+        "--cache-file",
+        type=str,
+        default=DEFAULT_CACHE_FILE,
+        help=(
+            "Path to the cache of album tags from previous runs "
+            f"(default: {DEFAULT_CACHE_FILE})."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Simulate the actions without modifying files.",
     )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Apply proposed changes without asking for confirmation.",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Collect the changes for all albums and confirm them once at the end.",
+    )
     return parser.parse_args()
 
 
@@ -56,11 +115,8 @@ def sanitize_filename(filename):
     Returns:
         str: The sanitized filename.
     """
-    # Replace forward slashes with hyphens
-    filename = filename.replace("/", "-")
-
-    # Remove or replace other potentially problematic characters
-    filename = re.sub(r'[<>:"|?*]', "", filename)
+    # Replace forward slashes and remove other potentially problematic characters
+    filename = filename.translate(_SANITIZE_TABLE)
 
     # Remove leading/trailing periods and spaces
     filename = filename.strip(". ")
@@ -79,21 +135,13 @@ def clean_album_name(name):
         str: The cleaned album name.
     """
     # Remove terms like "Soundtrack", "OST", etc.
-    terms_to_remove = [
-        r"\bOST\b",
-        r"\bSoundtrack\b",
-        r"\bOriginal Motion Picture Soundtrack\b",
-        r"\bOriginal Soundtrack\b",
-    ]
-    for term in terms_to_remove:
-        name = re.sub(term, "", name, flags=re.IGNORECASE).strip()
+    name = _RX_UNWANTED_TERMS.sub("", name).strip()
 
     # Remove any unwanted characters but preserve brackets that likely contain artist names
     # Modify the regex to only remove leading/trailing parentheses, dashes, or braces,
     # but not brackets if they are part of the artist's name.
     # For example, preserve ']' if it follows a '['
-    name = re.sub(
-        r"^[\s\-\(\{\[]+|[\s\-\)\}\]]+$",
+    name = _RX_TRIM_EDGES.sub(
         lambda match: match.group(0) if match.group(0) in ["[", "]"] else "",
         name,
     )
@@ -117,7 +165,7 @@ def construct_album_folder_name(album, format_type, year):
 
     # Step 1: Remove existing format and year information if present
     # This regex removes patterns like " (FLAC) [2013]" at the end of the string
-    album_cleaned = re.sub(r"\s*\([^)]*\)\s*\[\d{4}\]$", "", album)
+    album_cleaned = _RX_FMT_YEAR.sub("", album)
     # logging.debug(f"Album after removing existing format/year: '{album_cleaned}'")
 
     # Step 2: Prepare the additional information to append
@@ -127,7 +175,7 @@ def construct_album_folder_name(album, format_type, year):
     # logging.debug(f"Additional info to append: '{additional_info}'")
 
     # Step 3: Check if the album name contains an artist in brackets
-    match = re.match(r"^(.*?)\s*\[(.*?)\]$", album_cleaned)
+    match = _RX_ARTIST_BRACKET.match(album_cleaned)
     if match:
         album_name = match.group(1).strip()
         artist = match.group(2).strip()
@@ -148,6 +196,7 @@ def construct_album_folder_name(album, format_type, year):
     return sanitized_album
 
 
+@lru_cache(maxsize=4096)
 def parse_filename(filename):
     """
     Parse and validate filenames to extract disc number, track number, and title.
@@ -158,17 +207,22 @@ def parse_filename(filename):
     Returns:
         tuple: (disc_number, track_number, original_title, extension)
     """
-    name_without_ext, ext = os.path.splitext(filename)
-
-    # Primary pattern: disc - track - title
-    match = re.match(r"^(\d+)\s*-\s*(\d+)\s*-\s*(.+)$", name_without_ext)
-    if match:
-        disc_num, track_num, title = match.groups()
-        title = title.lstrip(" -.")  # Remove leading spaces, dashes, or dots
-        return disc_num, track_num, title.strip(), ext
-
-    # Secondary pattern: disc - track.title (handles variations)
-    match = re.match(r"^(\d+)\s*-\s*(\d+)\s*[.-]\s*(.+)$", name_without_ext)
+    name_without_ext, dot, ext = filename.rpartition(".")
+    if name_without_ext.strip("."):
+        ext = dot + ext
+    else:
+        # No dot, or only leading dots as in hidden files: there is no extension
+        name_without_ext, ext = filename, ""
+
+    # Fast path for the canonical "disc - track - title" form
+    parts = name_without_ext.split(" - ", 2)
+    if len(parts) == 3 and parts[0].isdecimal() and parts[1].isdecimal():
+        # Remove leading spaces, dashes, or dots
+        title = parts[2].lstrip().lstrip(" -.")
+        return parts[0], parts[1], title.strip(), ext
+
+    # Matches both "disc - track - title" and "disc - track.title"
+    match = _RX_DISC_TRACK.match(name_without_ext)
     if match:
         disc_num, track_num, title = match.groups()
         title = title.lstrip(" -.")  # Remove leading spaces, dashes, or dots
@@ -178,6 +232,56 @@ def parse_filename(filename):
     return "0", "00", name_without_ext.strip(), ext
 
 
+def _fast_move(src, dst):
+    """
+    Move a file with a single rename, falling back to shutil.move when the
+    destination is on another filesystem.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+
+def move_files_between(src_dir, dst_dir, names):
+    """
+    Move files from one directory to another, opening both directories once so
+    each rename is resolved relative to them instead of walking the full paths.
+
+    Args:
+        src_dir (str): Directory the files are in.
+        dst_dir (str): Directory the files are moved to; may be the same as src_dir.
+        names (list): (old_name, new_name) pairs of bare filenames.
+    """
+    if os.rename not in os.supports_dir_fd:
+        for old_name, new_name in names:
+            _fast_move(os.path.join(src_dir, old_name), os.path.join(dst_dir, new_name))
+        return
+
+    flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+    src_fd = os.open(src_dir, flags)
+    try:
+        dst_fd = src_fd if src_dir == dst_dir else os.open(dst_dir, flags)
+        try:
+            for old_name, new_name in names:
+                try:
+                    os.rename(old_name, new_name, src_dir_fd=src_fd, dst_dir_fd=dst_fd)
+                except OSError:
+                    # Most likely a move to another filesystem
+                    shutil.move(
+                        os.path.join(src_dir, old_name), os.path.join(dst_dir, new_name)
+                    )
+        finally:
+            if dst_fd != src_fd:
+                os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
 def move_all_contents(src, dst):
     """
     Move all files and subfolders from the source to the destination directory.
@@ -190,30 +294,35 @@ def move_all_contents(src, dst):
         s = os.path.join(src, item)
         d = os.path.join(dst, item)
         if os.path.isdir(s):
+            # shutil.move nests the folder if the destination already has one
             shutil.move(s, d)
         else:
-            shutil.move(s, d)
+            _fast_move(s, d)
 
 
 def highlight_filename_changes(old_name, new_name):
     if old_name != new_name:
-        return f"{Fore.RED}{old_name}{Style.RESET_ALL} -> {Fore.GREEN}{new_name}{Style.RESET_ALL}"
-    return f"{Fore.YELLOW}{old_name}"  # Yellow for unchanged files
+        return f"{_RED}{old_name}{_RST} -> {_GREEN}{new_name}{_RST}"
+    return f"{_YELLOW}{old_name}"  # Yellow for unchanged files
 
 
 def display_proposed_changes(
     root_path, current_album_name, new_album_name, proposed_changes
 ):
-    print(f"\nProcessing album: {Fore.CYAN}{current_album_name}")
+    # Build the whole listing and write it at once; every colored line ends
+    # with a reset, as autoreset would do for separate prints
+    parts = [f"\nProcessing album: {_CYAN}{current_album_name}{_RST}\n"]
+    append = parts.append
 
     if current_album_name != new_album_name:
-        print(f"Proposed rename: {Fore.GREEN}{new_album_name}")
+        append(f"Proposed rename: {_GREEN}{new_album_name}{_RST}\n")
 
     if not proposed_changes:
-        print(f"  {Fore.YELLOW}No changes needed for this album.")
+        append(f"  {_YELLOW}No changes needed for this album.{_RST}\n")
+        sys.stdout.write("".join(parts))
         return
 
-    print("\nProposed changes:")
+    append("\nProposed changes:\n")
     current_folder = None
     for before, after in proposed_changes:
         before_rel = os.path.relpath(before, root_path)
@@ -224,16 +333,18 @@ def display_proposed_changes(
 
         if before_folder != current_folder:
             if current_folder is not None:
-                print()  # Add a newline between folders
-            print(f"  {Fore.CYAN}{before_folder}/")
+                append("\n")  # Add a newline between folders
+            append(f"  {_CYAN}{before_folder}/{_RST}\n")
             if before_folder != after_folder:
-                print(f"  {Fore.GREEN}-> {after_folder}/")
+                append(f"  {_GREEN}-> {after_folder}/{_RST}\n")
             current_folder = before_folder
 
         before_file = os.path.basename(before_rel)
         after_file = os.path.basename(after_rel)
         if before_file != after_file:
-            print(f"    {highlight_filename_changes(before_file, after_file)}")
+            append(f"    {highlight_filename_changes(before_file, after_file)}{_RST}\n")
+
+    sys.stdout.write("".join(parts))
 
 
 def truncate_path(path, max_length=50):
@@ -245,6 +356,21 @@ def truncate_path(path, max_length=50):
     return os.path.join(parts[0], "...", *parts[-2:])
 
 
+def _dumps(data):
+    """
+    Serialize data to indented JSON bytes, using orjson when it is installed.
+
+    Args:
+        data (dict): The data to serialize.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode()
+
+
 def save_log(log_file):
     """
     Save log data to a JSON file for easy inspection.
@@ -253,32 +379,64 @@ def save_log(log_file):
         log_file (str): Path to the log file.
     """
     try:
-        with open(log_file, "w") as log:
-            json.dump(log_data, log, indent=4)
+        with open(log_file, "wb") as log:
+            log.write(_dumps(log_data))
         print(f"\nLog saved to {log_file}")
     except Exception as e:
         print(f"Error saving log file: {e}")
 
 
-def extract_year(audio_file):
+def load_cache(cache_file):
+    """
+    Load cached album tags from a previous run into metadata_cache.
+
+    Args:
+        cache_file (str): Path to the cache file.
+    """
+    try:
+        with open(cache_file) as cache:
+            metadata_cache.update(json.load(cache))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable cache file: {e}")
+
+
+def save_cache(cache_file):
+    """
+    Atomically save metadata_cache so unchanged albums are not re-read next time.
+
+    Args:
+        cache_file (str): Path to the cache file.
+    """
+    temp_file = f"{cache_file}.tmp"
+    try:
+        with open(temp_file, "w") as cache:
+            json.dump(metadata_cache, cache)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        print(f"Error saving cache file: {e}")
+
+
+def extract_year(date, file_path):
     """
     Extract the year from the 'date' field in metadata.
     If the 'date' field is not four digits or is malformed, return None.
 
     Args:
-        audio_file (mutagen.File): The audio file object.
+        date (str or None): The raw 'date' tag.
+        file_path (str): Path of the file the tag was read from, used for logging.
 
     Returns:
         str or None: Extracted year or None if invalid.
     """
-    date = audio_file.get("date", [None])[0]
     if date and len(date) >= 4 and date[:4].isdigit():
         return date[:4]  # Take only the first four digits as year
     else:
         # Log the issue if the date is invalid
         log_data["invalid_date_metadata"].append(
             {
-                "file": audio_file.filename,
+                "file": file_path,
                 "date_field": date,
                 "message": "Invalid or missing date field",
             }
@@ -286,7 +444,65 @@ def extract_year(audio_file):
         return None
 
 
-def reorganize_album(root_path, dry_run=False, log_file=DEFAULT_LOG_FILE):
+def iter_dirs_bottom_up(root_path):
+    """
+    Walk a directory tree bottom-up, like os.walk(topdown=False), using the
+    type information cached on each os.DirEntry instead of extra stat calls.
+
+    Args:
+        root_path (str): Path to the directory to walk.
+
+    Yields:
+        tuple: (folder_path, file_entries) where file_entries is a list of os.DirEntry.
+    """
+    try:
+        with os.scandir(root_path) as it:
+            entries = list(it)
+    except OSError:
+        return  # Skip unreadable directories, as os.walk does
+
+    files = []
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                yield from iter_dirs_bottom_up(entry.path)
+        else:
+            files.append(entry)
+    yield root_path, files
+
+
+def read_album_tags(file_path):
+    """
+    Read the album-level tags of a music file. Safe to call from worker threads;
+    errors are returned rather than logged.
+
+    Args:
+        file_path (str): Path to the music file.
+
+    Returns:
+        tuple: (tags, error) where tags is an (album, date) tuple or None,
+        and error is the exception raised while reading, or None.
+    """
+    try:
+        # One buffered read usually covers the whole tag block, instead of
+        # mutagen issuing many small reads against the file
+        with open(file_path, "rb", buffering=TAG_READ_BUFFER) as fileobj:
+            audio = File(fileobj, easy=True)
+        album = audio.get("album", ["Unknown Album"])[0]
+        date = audio.get("date", [None])[0]
+        return (album, date), None
+    except Exception as e:
+        return None, e
+
+
+def reorganize_album(
+    root_path,
+    dry_run=False,
+    log_file=DEFAULT_LOG_FILE,
+    cache_file=DEFAULT_CACHE_FILE,
+    assume_yes=False,
+    summary=False,
+):
     """
     Parse and organize albums by album.
 
@@ -294,114 +510,310 @@ def reorganize_album(root_path, dry_run=False, log_file=DEFAULT_LOG_FILE):
         root_path (str): Path to the root music library.
         dry_run (bool): If True, simulate actions without making changes.
         log_file (str): Path to the log file.
+        cache_file (str): Path to the cache file, saved if the user quits early.
+        assume_yes (bool): If True, apply changes without asking for confirmation.
+        summary (bool): If True, list all changes and confirm them once at the end.
     """
-    for root, dirs, files in os.walk(root_path, topdown=False):
+    queued = [] if summary else None
+
+    # Find every album first so their sample files can be read ahead of time
+    albums = []
+    for root, files in iter_dirs_bottom_up(root_path):
         if root == root_path:
             # Skip the root directory itself
             continue
 
         album_files = [
-            f for f in files if f.lower().endswith((".mp3", ".flac", ".ogg", ".wav"))
+            f
+            for f in files
+            if f.name.lower().endswith((".mp3", ".flac", ".ogg", ".wav"))
         ]
-        if not album_files:
-            continue  # Skip empty directories or non-music folders
+        if album_files:  # Skip empty directories or non-music folders
+            albums.append((root, album_files))
+
+    # Skip sample files whose modification time and size match the cache
+    lookups = []
+    for root, album_files in albums:
+        sample = album_files[0]
+        key = os.path.abspath(sample.path)
+        try:
+            st = sample.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp = None
+        cached = metadata_cache.get(key)
+        if stamp is None or cached is None or cached["stamp"] != stamp:
+            cached = None
+        lookups.append((key, stamp, cached))
+
+    # Read the remaining sample files in parallel, keeping PREFETCH_DEPTH albums
+    # ahead of the one being confirmed rather than reading the whole library up front
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {}
+        next_read = 0
+        seen = set()
+        for current, (root, album_files) in enumerate(albums):
+            # Keep the read-ahead window PREFETCH_DEPTH albums past the current one
+            read_until = min(len(albums), current + PREFETCH_DEPTH + 1)
+            while next_read < read_until:
+                if lookups[next_read][2] is None:
+                    sample_path = albums[next_read][1][0].path
+                    futures[next_read] = executor.submit(read_album_tags, sample_path)
+                next_read += 1
+
+            key, stamp, cached = lookups[current]
+            if cached is not None:
+                tags, load_error = (cached["album"], cached["date"]), None
+            else:
+                tags, load_error = futures.pop(current).result()
+                if load_error is None and stamp is not None:
+                    metadata_cache[key] = {
+                        "stamp": stamp,
+                        "album": tags[0],
+                        "date": tags[1],
+                    }
+            seen.add(key)
+            process_album(
+                root_path,
+                root,
+                album_files,
+                tags,
+                load_error,
+                dry_run=dry_run,
+                log_file=log_file,
+                cache_file=cache_file,
+                assume_yes=assume_yes,
+                queued=queued,
+            )
+    finally:
+        # Don't keep reading the rest of the library if the user quits early
+        executor.shutdown(cancel_futures=True)
+
+    # Forget files in this library that were moved or deleted since they were cached;
+    # entries for other libraries sharing the cache file are kept
+    library_prefix = os.path.join(os.path.abspath(root_path), "")
+    for key in list(metadata_cache):
+        if key.startswith(library_prefix) and key not in seen:
+            del metadata_cache[key]
 
-        # Create a list to track file movements
-        proposed_changes = []
+    if queued is not None:
+        apply_queued_changes(root_path, queued, dry_run, assume_yes)
 
-        # Extract common metadata for the album
-        sample_file = os.path.join(root, album_files[0])
+
+def apply_queued_changes(root_path, queued, dry_run, assume_yes):
+    """
+    List the changes collected for every album and apply them after a single
+    confirmation.
+
+    Args:
+        root_path (str): Path to the root music library.
+        queued (list): (root, current_album_name, album_name, target_dir,
+            proposed_changes) for each album.
+        dry_run (bool): If True, simulate actions without making changes.
+        assume_yes (bool): If True, apply the changes without asking for confirmation.
+    """
+    if not queued:
+        print("\nNo changes needed for any album.")
+        return
+
+    for root, current_album_name, album_name, target_dir, proposed_changes in queued:
+        display_proposed_changes(
+            root_path, current_album_name, album_name, proposed_changes
+        )
+
+    file_count = sum(len(album[4]) for album in queued)
+    print(f"\nSummary: {file_count} files to move in {len(queued)} albums.")
+
+    if not assume_yes:
+        while True:
+            response = input("\nApply all changes? (y = yes, n = no): ").strip().lower()
+            if response == "y":
+                break
+            elif response == "n":
+                print("Skipping all album changes.")
+                return
+            else:
+                print("Invalid input. Please enter 'y' or 'n'.")
+
+    for root, current_album_name, album_name, target_dir, proposed_changes in queued:
+        apply_album_changes(root, target_dir, proposed_changes, dry_run)
+
+
+def apply_album_changes(root, target_dir, proposed_changes, dry_run):
+    """
+    Move an album's files to their new names and folder, then remove the old folder.
+
+    Args:
+        root (str): Path to the album folder.
+        target_dir (str): Path to the new album folder.
+        proposed_changes (list): (before, after) paths of the files to move.
+        dry_run (bool): If True, simulate actions without making changes.
+    """
+    if dry_run:
+        print("[DRY RUN] Confirmed. No changes will be made.")
+        return
+
+    print("Applying changes...")
+    names = [
+        (os.path.basename(before), os.path.basename(after))
+        for before, after in proposed_changes
+    ]
+    same_parent = os.path.dirname(target_dir) == os.path.dirname(root)
+    rename_folder = same_parent and not os.path.exists(target_dir)
+    if rename_folder:
+        # Rename the album folder in one go, then rename the files inside it
+        os.rename(root, target_dir)
+        print(f"  Renamed folder: {root} -> {target_dir}")
+        names = [(old, new) for old, new in names if old != new]
+        move_files_between(target_dir, target_dir, names)
+    else:
+        os.makedirs(target_dir, exist_ok=True)
+        move_files_between(root, target_dir, names)
+    for before, after in proposed_changes:
+        print(f"  Moved: {before} -> {after}")
+
+    if not rename_folder:
+        # Move remaining files and subfolders
+        move_all_contents(root, target_dir)
+
+        # Remove the old folder
+        try:
+            os.rmdir(root)
+            print(f"  Removed empty folder: {root}")
+        except OSError:
+            print(f"  Warning: Could not remove folder {root}. It may not be empty.")
+
+
+def process_album(
+    root_path,
+    root,
+    album_files,
+    tags,
+    load_error,
+    *,
+    dry_run,
+    log_file,
+    cache_file,
+    assume_yes=False,
+    queued=None,
+):
+    """
+    Propose and, once confirmed, apply the reorganization of a single album.
+
+    Args:
+        root_path (str): Path to the root music library.
+        root (str): Path to the album folder.
+        album_files (list): The album's music files as os.DirEntry objects.
+        tags (tuple): The (album, date) tags of the sample file, or None if reading
+            failed.
+        load_error (Exception): The error raised while reading the sample file, if any.
+        dry_run (bool): If True, simulate actions without making changes.
+        log_file (str): Path to the log file.
+        cache_file (str): Path to the cache file.
+        assume_yes (bool): If True, apply the changes without asking for confirmation.
+        queued (list): If given, the proposed changes are appended to it instead of
+            being confirmed now.
+    """
+    # Create a list to track file movements
+    proposed_changes = []
+
+    # Extract common metadata for the album
+    sample_file = album_files[0].path
+    if load_error is not None:
+        log_data["invalid_filenames"].append(
+            {"file": sample_file, "error": str(load_error)}
+        )
+        return
+    try:
+        album, date = tags
+        year = extract_year(date, sample_file)
+        format_type = os.path.splitext(sample_file)[1][1:].upper()
+    except Exception as e:
+        log_data["invalid_filenames"].append({"file": sample_file, "error": str(e)})
+        return
+
+    # Clean the album name
+    album = clean_album_name(album)
+
+    # Construct new album folder name
+    album_name = construct_album_folder_name(album, format_type, year)
+
+    # Preserve the parent folder structure
+    relative_path = os.path.relpath(root, root_path)
+    parent_folder = os.path.dirname(relative_path)
+    target_dir = os.path.join(root_path, parent_folder, album_name)
+
+    # Files only stay put if the album folder itself keeps its path
+    same_dir = os.path.normpath(root) == os.path.normpath(target_dir)
+
+    # Process each file in the album
+    for file in album_files:
+        file_path = file.path
         try:
-            audio = File(sample_file, easy=True)
-            album = audio.get("album", ["Unknown Album"])[0]
-            year = extract_year(audio)
-            format_type = os.path.splitext(sample_file)[1][1:].upper()
+            disc_number, track_number, original_title, ext = parse_filename(file.name)
+
+            # Construct the new filename
+            new_filename = f"{disc_number} - {track_number}. {original_title}{ext}"
+            new_file_path = os.path.join(target_dir, new_filename)
+
+            if not same_dir or file.name != new_filename:
+                proposed_changes.append((file_path, new_file_path))
         except Exception as e:
-            log_data["invalid_filenames"].append({"file": sample_file, "error": str(e)})
-            continue
+            log_data["invalid_filenames"].append({"file": file_path, "error": str(e)})
 
-        # Clean the album name
-        album = clean_album_name(album)
-
-        # Construct new album folder name
-        album_name = construct_album_folder_name(album, format_type, year)
-
-        # Preserve the parent folder structure
-        relative_path = os.path.relpath(root, root_path)
-        parent_folder = os.path.dirname(relative_path)
-        target_dir = os.path.join(root_path, parent_folder, album_name)
-
-        # Process each file in the album
-        for file in album_files:
-            file_path = os.path.join(root, file)
-            try:
-                disc_number, track_number, original_title, ext = parse_filename(file)
-
-                # Construct the new filename
-                new_filename = f"{disc_number} - {track_number}. {original_title}{ext}"
-                new_file_path = os.path.join(target_dir, new_filename)
-
-                if os.path.abspath(file_path) != os.path.abspath(new_file_path):
-                    proposed_changes.append((file_path, new_file_path))
-            except Exception as e:
-                log_data["invalid_filenames"].append(
-                    {"file": file_path, "error": str(e)}
-                )
-
-        # Present and confirm changes
-        current_album_name = os.path.basename(root)
-        if proposed_changes:
-            display_proposed_changes(
-                root_path, current_album_name, album_name, proposed_changes
-            )
+    # Present and confirm changes
+    current_album_name = os.path.basename(root)
+    if not proposed_changes:
+        if queued is None:
+            print(f"\nProcessing album: {_CYAN}{current_album_name}")
+            print(f"  {_YELLOW}No changes needed for this album.")
+        return
+
+    if queued is not None:
+        queued.append(
+            (root, current_album_name, album_name, target_dir, proposed_changes)
+        )
+        return
 
-            while True:
-                response = (
-                    input("\nConfirm changes? (y = yes, n = no, q = quit): ")
-                    .strip()
-                    .lower()
-                )
-                if response == "y":
-                    if dry_run:
-                        print("[DRY RUN] Confirmed. No changes will be made.")
-                    else:
-                        print("Applying changes...")
-                        os.makedirs(target_dir, exist_ok=True)
-                        for before, after in proposed_changes:
-                            shutil.move(before, after)
-                            print(f"  Moved: {before} -> {after}")
-
-                        # Move remaining files and subfolders
-                        move_all_contents(root, target_dir)
-
-                        # Remove the old folder
-                        try:
-                            os.rmdir(root)
-                            print(f"  Removed empty folder: {root}")
-                        except OSError:
-                            print(
-                                f"  Warning: Could not remove folder {root}. It may not be empty."
-                            )
-                    break
-                elif response == "n":
-                    print("Skipping album changes.")
-                    break
-                elif response == "q":
-                    print("Quitting the script.")
-                    save_log(log_file)
-                    exit(0)
-                else:
-                    print("Invalid input. Please enter 'y', 'n', or 'q'.")
+    display_proposed_changes(
+        root_path, current_album_name, album_name, proposed_changes
+    )
+    if assume_yes:
+        apply_album_changes(root, target_dir, proposed_changes, dry_run)
+        return
+
+    while True:
+        response = (
+            input("\nConfirm changes? (y = yes, n = no, q = quit): ").strip().lower()
+        )
+        if response == "y":
+            apply_album_changes(root, target_dir, proposed_changes, dry_run)
+            break
+        elif response == "n":
+            print("Skipping album changes.")
+            break
+        elif response == "q":
+            print("Quitting the script.")
+            save_cache(cache_file)
+            save_log(log_file)
+            exit(0)
         else:
-            print(f"\nProcessing album: {Fore.CYAN}{current_album_name}")
-            print(f"  {Fore.YELLOW}No changes needed for this album.")
+            print("Invalid input. Please enter 'y', 'n', or 'q'.")
 
 
 def main():
     args = parse_arguments()
+    load_cache(args.cache_file)
     reorganize_album(
-        root_path=args.library_path, dry_run=args.dry_run, log_file=args.log_file
+        root_path=args.library_path,
+        dry_run=args.dry_run,
+        log_file=args.log_file,
+        cache_file=args.cache_file,
+        assume_yes=args.yes,
+        summary=args.summary,
     )
+    save_cache(args.cache_file)
     save_log(args.log_file)
 
 
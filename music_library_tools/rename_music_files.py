@@ -36,7 +36,8 @@ def rename_files(directory, prefix, dry_run=False):
         dry_run (bool): If True, simulate actions without renaming files.
     """
     try:
-        files = os.listdir(directory)
+        with os.scandir(directory) as it:
+            entries = list(it)
     except FileNotFoundError:
         print(f"Error: The directory '{directory}' does not exist.")
         return
@@ -44,10 +45,11 @@ def rename_files(directory, prefix, dry_run=False):
         print(f"Error: Permission denied for directory '{directory}'.")
         return
 
-    for file in files:
-        file_path = os.path.join(directory, file)
-        # Check if it's a file (not a directory)
-        if os.path.isfile(file_path):
+    for entry in entries:
+        file = entry.name
+        file_path = entry.path
+        # Check if it's a file (not a directory), reusing the type from the directory listing
+        if entry.is_file():
             new_name = f"{prefix}{file}"
             new_file_path = os.path.join(directory, new_name)
             
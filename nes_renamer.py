@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 import xml.etree.ElementTree as ET
@@ -7,6 +8,16 @@ import argparse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# Extracts the game name and region code from a ROM filename stem, e.g. "Metroid (U)"
+_RX_NES = re.compile(r'^(.*?)\s*\(([UuEeJj])\)$')
+
+# Region suffixes of the common "Name (U)" form, checked before falling back to _RX_NES
+_REGION_SUFFIXES = (' (U)', ' (E)', ' (J)', ' (u)', ' (e)', ' (j)')
+
+# Region codes in ROM filenames and the full names used by the DAT file
+_REGION_MAP = {'U': 'USA', 'E': 'Europe', 'J': 'Japan'}
 
 def parse_dat(dat_path):
     """
@@ -17,27 +28,34 @@ def parse_dat(dat_path):
         dat_path (Path): Path to the DAT file.
 
     Returns:
-        dict: A dictionary mapping game names to ROM names.
+        dict: A dictionary mapping lowercased game names to ROM names.
     """
+    game_names = {}
     try:
-        # Attempt to parse the XML file
-        tree = ET.parse(dat_path)
+        # Stream the XML file, detaching each 'game' element from its parent once
+        # it has been read so finished games are freed instead of kept in the tree
+        parents = []
+        for event, elem in ET.iterparse(dat_path, events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                continue
+            parents.pop()
+            if elem.tag != 'game':
+                continue
+            name = elem.get('name')
+            rom = elem.find('rom')
+            # Unnamed games can never match a ROM filename
+            if name is not None and rom is not None:
+                rom_name = rom.get('name')
+                game_names[name.lower()] = rom_name
+            if parents:
+                parents[-1].remove(elem)
     except ET.ParseError as e:
-        logging.error(f"Error parsing DAT file: {e}")
+        logger.error("Error parsing DAT file: %s", e)
         sys.exit(1)
     except FileNotFoundError:
-        logging.error(f"DAT file not found: {dat_path}")
+        logger.error("DAT file not found: %s", dat_path)
         sys.exit(1)
-    
-    root = tree.getroot()
-    game_names = {}
-    # Iterate through all 'game' elements in the XML
-    for game in root.findall('.//game'):
-        name = game.get('name')
-        rom = game.find('rom')
-        if rom is not None:
-            rom_name = rom.get('name')
-            game_names[name] = rom_name
     return game_names
 
 def rename_roms(input_dir, dat_path):
@@ -54,41 +72,48 @@ def rename_roms(input_dir, dat_path):
     dat_path = Path(dat_path)
     
     if not input_path.is_dir():
-        logging.error(f"Input directory does not exist: {input_dir}")
+        logger.error("Input directory does not exist: %s", input_dir)
         sys.exit(1)
     
     game_names = parse_dat(dat_path)
     
-    for file in input_path.iterdir():
-        if file.suffix.lower() == '.nes':
-            # This regex extracts the game name and region code from the filename
-            match = re.match(r'^(.*?)\s*\(([UuEeJj])\)$', file.stem)
-            if match:
-                game_name, region = match.groups()
-                region = region.upper()
-                
-                # Convert region code to full name for DAT file matching
-                region_full = {'U': 'USA', 'E': 'Europe', 'J': 'Japan'}.get(region, 'Unknown')
-                dat_name = f"{game_name} ({region_full})"
-                
-                if dat_name in game_names:
-                    new_filename = game_names[dat_name]
-                    new_file = input_path / new_filename
-                    
-                    # Prevent overwriting existing files
-                    if new_file.exists():
-                        logging.warning(f"Cannot rename {file.name} to {new_filename}: Destination file already exists.")
-                        continue
-                    
-                    try:
-                        file.rename(new_file)
-                        logging.info(f"Renamed: {file.name} -> {new_filename}")
-                    except Exception as e:
-                        logging.error(f"Failed to rename {file.name}: {e}")
-                else:
-                    logging.warning(f"No match found for: {file.name}")
-            else:
-                logging.warning(f"Filename format not recognized: {file.name}")
+    # List the directory once; the names double as the collision check for renames.
+    # They are casefolded so that case-insensitive filesystems are also protected.
+    with os.scandir(input_path) as it:
+        entries = list(it)
+    existing = {entry.name.casefold() for entry in entries}
+    rom_entries = [entry for entry in entries if entry.name.lower().endswith('.nes')]
+
+    for entry in rom_entries:
+        stem = os.path.splitext(entry.name)[0]
+        if stem.endswith(_REGION_SUFFIXES):
+            game_name, region = stem[:-4].rstrip(), stem[-2]
+        else:
+            match = _RX_NES.match(stem)
+            if not match:
+                logger.warning("Filename format not recognized: %s", entry.name)
+                continue
+            game_name, region = match.groups()
+
+        # Convert region code to full name for case-insensitive DAT file matching
+        dat_name = f"{game_name} ({_REGION_MAP[region.upper()]})".lower()
+        new_filename = game_names.get(dat_name)
+        
+        if new_filename is not None:
+            # Prevent overwriting existing files
+            if new_filename.casefold() in existing:
+                logger.warning("Cannot rename %s to %s: Destination file already exists.", entry.name, new_filename)
+                continue
+            
+            try:
+                os.rename(entry.path, os.path.join(input_path, new_filename))
+                existing.discard(entry.name.casefold())
+                existing.add(new_filename.casefold())
+                logger.info("Renamed: %s -> %s", entry.name, new_filename)
+            except Exception as e:
+                logger.error("Failed to rename %s: %s", entry.name, e)
+        else:
+            logger.warning("No match found for: %s", entry.name)
 
 def main():
     # Set up command-line argument parsing